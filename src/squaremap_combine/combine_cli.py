@@ -47,6 +47,10 @@ def main(): # pylint: disable=missing-function-docstring
     parser.add_argument(*opt('--output-ext'), '-ext', type=str, default='png', metavar='EXTENSION',
         help='The output file extension (format) to use for the created image. Supports anything Pillow does. (e.g. "png", "jpg", "webp")')
 
+    parser.add_argument(*opt('--compress-level'), '-cl', type=int, default=6, choices=range(10), metavar='LEVEL',
+        help='The zlib compression level (0-9) to use when saving PNG images. Defaults to 6.\n' +
+        'Lower levels save considerably faster in exchange for a larger file, which can help a lot with very large maps.')
+
     parser.add_argument(*opt('--timestamp'), '-t', type=str, nargs='*', default='', metavar='FORMAT_STRING',
         help='Adds a timestamp of the given format to the beginning of the image file name.\n ' +
         'Default format "?Y-?m-?d_?H-?M-?S" will be used if no format is specified after this argument.\n' +
@@ -60,8 +64,8 @@ def main(): # pylint: disable=missing-function-docstring
 
     parser.add_argument(*opt('--area'), '-a', type=int, nargs=4, default=None, metavar=('X1', 'Y1', 'X2', 'Y2'),
         help='A rectangle area of the world (top, left, bottom, right) to export an image from.\n' +
-        'This can save time when using a very large world map, as this will only combine the minimum amount of regions' +
-        ' needed to cover this area, before finally cropping it down to only the given area.\n' +
+        'This can save time when using a very large world map, as only the regions overlapping this area are loaded,' +
+        ' and only their parts within it are pasted into an image of the area\'s size.\n' +
         'These values should be the coordinates of the area as they would be in the actual Minecraft world.')
 
     parser.add_argument(*opt('--no-autotrim'), action='store_false',
@@ -102,6 +106,7 @@ def main(): # pylint: disable=missing-function-docstring
     detail      : int  = args.detail
     output_dir  : Path = args.output_dir
     output_ext  : str  = args.output_ext
+    compress_level: int = args.compress_level
     time_format : str
     if isinstance(args.timestamp, list):
         if len(args.timestamp) == 0:
@@ -151,6 +156,7 @@ def main(): # pylint: disable=missing-function-docstring
         Detail level: {detail}
         Output directory: {output_dir.absolute()}
         Output file extension: {output_ext}
+        PNG compression level: {compress_level}
         Grid interval: {grid_interval}
         Specified area: {area if area else 'None, will render the entire map'}
 
@@ -218,6 +224,7 @@ def main(): # pylint: disable=missing-function-docstring
         return None
 
     logger.info(f'Saving to "{out_file}"...')
-    image.save(out_file)
+    # Formats other than PNG ignore this option
+    image.save(out_file, compress_level=compress_level)
 
     logger.info('Done!')
@@ -4,7 +4,9 @@ Core functionality for squaremap_combine, providing the `Combiner` class amongst
 
 import json
 import operator
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from itertools import product
 from pathlib import Path
@@ -14,8 +16,8 @@ from PIL import Image, ImageDraw, ImageFont
 from tqdm import tqdm
 
 from squaremap_combine.errors import AssertionMessage
-from squaremap_combine.helper import (Color, ConfirmationCallback, StyleJSONEncoder, copy_method_signature,
-                                      snap_box)
+from squaremap_combine.helper import (Color, ConfirmationCallback, StyleJSONEncoder, bounded_map,
+                                      copy_method_signature, snap_box)
 from squaremap_combine.logging import logger
 from squaremap_combine.project import ASSET_DIR
 from squaremap_combine.type_alias import Rectangle
@@ -35,8 +37,13 @@ DEFAULT_OUTFILE_FORMAT = '{timestamp}{world}-{detail}.{output_ext}'
 DETAIL_SBPP: dict[int, int] = {0: 8, 1: 4, 2: 2, 3: 1}
 """Square-blocks-per-pixel for each detail level."""
 
+NO_ALPHA_FORMATS: set[str] = {'JPEG'}
+"""Pillow format names which cannot store an alpha channel, so images need to be converted to RGB before being saved as them."""
+
 class Coord2i:
     """Represents a 2D integer coordinate pair."""
+    __slots__ = ('x', 'y')
+
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
@@ -48,8 +55,7 @@ class Coord2i:
         return f'({self.x}, {self.y})'
 
     def __iter__(self) -> Iterator[int]:
-        for i in [self.x, self.y]:
-            yield i
+        return iter((self.x, self.y))
 
     def as_tuple(self) -> tuple[int, int]:
         """Returns the coordinate as a tuple."""
@@ -57,14 +63,16 @@ class Coord2i:
 
     def _math(self, math_op: Callable, other: 'int | tuple[int, int] | Coord2i', direction: Literal['l', 'r']='l') -> 'Coord2i':
         if isinstance(other, int):
-            other = (other, other)
+            other_x = other_y = other
         elif isinstance(other, Coord2i):
-            other = (other.x, other.y)
+            other_x, other_y = other.x, other.y
+        else:
+            other_x, other_y = other
 
         if direction == 'l':
-            return Coord2i(math_op(self.x, other[0]), math_op(self.y, other[1]))
+            return Coord2i(math_op(self.x, other_x), math_op(self.y, other_y))
         if direction == 'r':
-            return Coord2i(math_op(other[0], self.x), math_op(other[1], self.y))
+            return Coord2i(math_op(other_x, self.x), math_op(other_y, self.y))
         raise ValueError(f'_math direction must be "l" or "r"; got {direction!r}')
 
     def __add__(self, other: 'int | tuple[int, int] | Coord2i') -> 'Coord2i':
@@ -97,6 +105,8 @@ class GameCoord(Coord2i):
     Largely identical to `Coord2i`, but used mainly for typing to more effectively signal what kind of coordinate is expected
     for a given class or function.
     """
+    __slots__ = ()
+
     def __repr__(self):
         return f'GameCoord(x={self.x}, y={self.y})'
 
@@ -109,6 +119,8 @@ class MapImageCoord(Coord2i):
     Largely identical to `Coord2i`, but used mainly for typing to more effectively signal what kind of coordinate is expected
     for a given class or function.
     """
+    __slots__ = ()
+
     def __repr__(self):
         return f'MapImageCoord(x={self.x}, y={self.y})'
 
@@ -155,8 +167,14 @@ class MapImage:
     def paste(self, *args, **kwargs): # pylint: disable=missing-function-docstring
         self.img.paste(*args, **kwargs)
     @copy_method_signature(Image.Image.save)
-    def save(self, *args, **kwargs): # pylint: disable=missing-function-docstring
-        self.img.save(*args, **kwargs)
+    def save(self, fp, format=None, **params): # pylint: disable=missing-function-docstring,redefined-builtin
+        if (format is None) and isinstance(fp, (str, Path)):
+            format = Image.registered_extensions().get(Path(fp).suffix.lower())
+        # Pillow refuses to write RGBA images to formats that can't store an alpha channel, so drop it for those
+        if (self.mode == 'RGBA') and (str(format).upper() in NO_ALPHA_FORMATS):
+            self.img.convert('RGB').save(fp, format, **params)
+        else:
+            self.img.save(fp, format, **params)
 
     def crop(self, box: Rectangle) -> 'MapImage':
         """Returns a cropped portion of the original image, along with an accordingly updated `game_zero` property."""
@@ -252,6 +270,8 @@ class Combiner:
     Only made a constant in case squaremap happens to change its image sizes in the future.
     """
     STANDARD_WORLDS: list[str] = ['overworld', 'the_nether', 'the_end']
+    TILE_LOADING_THREADS: int = min(32, (os.cpu_count() or 1) + 4)
+    """How many threads to use for opening and decoding tile images in parallel. Matches `ThreadPoolExecutor`'s default."""
     def __init__(self,
             tiles_dir: str | Path,
             use_tqdm=False,
@@ -308,54 +328,96 @@ class Combiner:
         self.grid_coords_format    = grid_coords_format
         self.style                 = style
 
-        self.mapped_worlds: list[str] = [p.stem for p in tiles_dir.glob('minecraft_*/')]
+        with os.scandir(tiles_dir) as entries:
+            mapped_worlds = [e.name for e in entries if e.name.startswith('minecraft_') and e.is_dir()]
+        self.mapped_worlds: list[str] = mapped_worlds
         """What valid world folders the given `tiles_dir` contains."""
 
+    @staticmethod
+    def _load_tile(tile_path: str | Path) -> tuple[Image.Image, tuple[int, int]]:
+        """Opens and fully decodes a tile image, so that the work is done by whichever thread calls this.
+
+        :returns: The loaded tile image, and the lowest and highest alpha values found in it.
+        :rtype: tuple[Image.Image, tuple[int, int]]
+        """
+        tile_img = Image.open(tile_path)
+        tile_img.load()
+        if 'A' not in tile_img.getbands():
+            return tile_img, (255, 255)
+        return tile_img, cast(tuple[int, int], tile_img.getchannel('A').getextrema())
+
+    @staticmethod
+    def _find_bbox(image: Image.Image, extent: Rectangle, tile_size: int) -> Rectangle | None:
+        """Finds the same bounding box `getbbox()` would for an image whose non-transparent pixels all lie within `extent`,
+        by only scanning a tile-wide strip along each of the extent's edges rather than the whole image.
+
+        :param image: The image to find the bounding box of.
+        :param extent: Box outside of which the image is known to be fully transparent.
+        :param tile_size: The width of the strip scanned along each edge.
+        """
+        left, top, right, bottom = extent
+        if (right - left <= tile_size * 2) or (bottom - top <= tile_size * 2):
+            return image.getbbox()
+
+        # Anything non-transparent found in an edge strip is necessarily the outermost on that side; if a strip is empty,
+        # the real edge lies somewhere further in, and it's simplest to fall back to a full scan
+        strips = (
+            image.crop((left, top, left + tile_size, bottom)).getbbox(),
+            image.crop((left, top, right, top + tile_size)).getbbox(),
+            image.crop((right - tile_size, top, right, bottom)).getbbox(),
+            image.crop((left, bottom - tile_size, right, bottom)).getbbox(),
+        )
+        if not all(strips):
+            return image.getbbox()
+        left_strip, top_strip, right_strip, bottom_strip = cast(tuple[Rectangle, ...], strips)
+        return (
+            left + left_strip[0],
+            top + top_strip[1],
+            right - tile_size + right_strip[2],
+            bottom - tile_size + bottom_strip[3],
+        )
+
+    def _grid_axes(self, image: MapImage, lower_bound: int) -> dict[str, set[int]]:
+        """Returns the image X ('h') and Y ('v') positions at which this instance's grid intervals fall on the given image,
+        stepping outwards from its `game_zero` in both directions.
+
+        :param lower_bound: Exclusive lower limit for positions when stepping backwards from `game_zero`.
+        """
+        grid_origin = image.game_zero
+        step_x = self.grid_interval[0] // image.detail_mul
+        step_y = self.grid_interval[1] // image.detail_mul
+        return {
+            'h': set(range(grid_origin.x, image.width, step_x)).union(range(grid_origin.x, lower_bound, -step_x)),
+            'v': set(range(grid_origin.y, image.height, step_y)).union(range(grid_origin.y, lower_bound, -step_y)),
+        }
+
     def draw_grid_lines(self, image: MapImage) -> None:
         """Draws grid lines onto a `MapImage` at the intervals defined for this `Combiner` instance.
 
         :param image: The `MapImage` to draw coordinates onto. Its `game_zero` attribute is used as the origin point.
         """
         idraw = ImageDraw.Draw(image.img)
-        grid_origin = image.game_zero
-        coord_axes: dict[str, set[int]] = {
-            'h': set(
-                [*range(grid_origin.x, image.width, self.grid_interval[0] // image.detail_mul)] +
-                [*range(grid_origin.x, 0, -self.grid_interval[0] // image.detail_mul)]
-                ),
-            'v': set(
-                [*range(grid_origin.y, image.height, self.grid_interval[1] // image.detail_mul)] +
-                [*range(grid_origin.y, 0, -self.grid_interval[1] // image.detail_mul)]
-                ),
-        }
+        coord_axes = self._grid_axes(image, lower_bound=0)
 
+        # Each line is a single C call that only touches the pixels on that line, which is cheaper than any
+        # whole-image approach for the amount of lines a grid will realistically have
+        fill = self.style.grid_line_color.to_rgba()
+        width, height = image.size
         for x in coord_axes['h']:
-            idraw.line((x, 0, x, image.height), fill=self.style.grid_line_color.to_rgba())
+            idraw.line((x, 0, x, height), fill=fill)
         for y in coord_axes['v']:
-            idraw.line((0, y, image.width, y), fill=self.style.grid_line_color.to_rgba())
+            idraw.line((0, y, width, y), fill=fill)
 
     def draw_grid_coords_text(self, image: MapImage) -> None:
         """Draws coordinate text onto a `MapImage` at every interval as defined for this `Combiner` instance.
 
         :param image: The `MapImage` to draw coordinates onto. Its `game_zero` attribute is used as the origin point.
         """
-        bbox_before_grid = image.getbbox()
-        assert bbox_before_grid
-
         grid_origin = image.game_zero
+        coord_axes = self._grid_axes(image, lower_bound=-1)
 
-        coord_axes: dict[str, set[int]] = {
-            'h': set(
-                [*range(grid_origin.x, image.width, self.grid_interval[0] // image.detail_mul)] +
-                [*range(grid_origin.x, -1, -self.grid_interval[0] // image.detail_mul)]
-                ),
-            'v': set(
-                [*range(grid_origin.y, image.height, self.grid_interval[1] // image.detail_mul)] +
-                [*range(grid_origin.y, -1, -self.grid_interval[1] // image.detail_mul)]
-                ),
-        }
-
-        interval_coords: list[MapImageCoord] = [MapImageCoord(x, y) for x in coord_axes['h'] for y in coord_axes['v']]
+        # Plain integer pairs rather than `MapImageCoord` objects, since there can be tens of thousands of these
+        interval_coords: list[tuple[int, int]] = [(x, y) for x in coord_axes['h'] for y in coord_axes['v']]
         total_intervals = len(interval_coords)
 
         if total_intervals > 50000:
@@ -371,14 +433,24 @@ class Combiner:
         logger.info('Drawing coordinates...')
         idraw = ImageDraw.Draw(image.img)
         font = ImageFont.truetype(self.style.grid_text_font, size=self.style.grid_text_size)
-
+        fill = self.style.grid_text_color.to_rgba()
+        coords_format = self.grid_coords_format
+        describe_progress = self.use_tqdm and (total_intervals <= 5000)
+        # Equivalent to `MapImageCoord.to_game_coord()`, inlined for the same reason as above
+        zero_x, zero_y = grid_origin.as_tuple()
+        detail_mul = image.detail_mul
+
+        gui_percent = -1
         for img_coord in (pbar := tqdm(interval_coords, disable=not self.use_tqdm)):
-            logger.log('GUI_COMMAND', f'/pbar set {pbar.n / total_intervals}')
-            game_coord = img_coord.to_game_coord(image)
-            coord_text = self.grid_coords_format.format(x=game_coord.x, y=game_coord.y)
-            if self.use_tqdm and (total_intervals <= 5000):
-                pbar.set_description(f'Drawing {coord_text} at {img_coord.as_tuple()}')
-            idraw.text(xy=img_coord.as_tuple(), text=str(coord_text), fill=self.style.grid_text_color.to_rgba(), font=font)
+            # Only tell the GUI about whole percentage changes, rather than sending a log message for every label
+            if (percent := (100 * pbar.n) // total_intervals) != gui_percent:
+                gui_percent = percent
+                logger.log('GUI_COMMAND', f'/pbar set {percent / 100}')
+            x, y = img_coord
+            coord_text = coords_format.format(x=(x - zero_x) * detail_mul, y=(y - zero_y) * detail_mul)
+            if describe_progress:
+                pbar.set_description(f'Drawing {coord_text} at {img_coord}', refresh=False)
+            idraw.text(xy=img_coord, text=coord_text, fill=fill, font=font)
         logger.log('GUI_COMMAND', '/pbar hide')
 
     def combine(self, *,
@@ -413,19 +485,22 @@ class Combiner:
         # Sort out what regions we're going to stitch
         columns: set[int] = set()
         rows: set[int] = set()
-        regions: dict[int, dict[int, Path]] = {}
+        # Keyed by (column, row); the order tiles are pasted in comes from the column and row ranges below,
+        # so this never needs sorting
+        regions: dict[tuple[int, int], str] = {}
         logger.info('Finding region images...')
-        for img in tqdm(source_dir.glob('*_*.png'), disable=not self.use_tqdm):
-            col, row = map(int, img.stem.split('_'))
-            if col not in regions:
+        # Equivalent to globbing for "*_*.png", but works from the names scandir() already has instead of
+        # building and re-parsing a Path for every tile
+        with os.scandir(source_dir) as entries:
+            for entry in tqdm(entries, disable=not self.use_tqdm):
+                name = entry.name
+                if not name.endswith('.png') or ('_' not in name):
+                    continue
+                col, row = map(int, name[:-4].split('_'))
                 columns.add(col)
-                regions[col] = {}
-            if row not in regions[col]:
                 rows.add(row)
-                regions[col][row] = img
+                regions.setdefault((col, row), entry.path)
 
-        # Deep-sort columns + rows
-        regions = {k:{v:regions[k][v] for v in sorted(regions[k].keys())} for k in sorted(regions.keys())}
         column_range = range(min(columns), max(columns) + 1)
         row_range = range(min(rows), max(rows) + 1)
 
@@ -434,63 +509,120 @@ class Combiner:
             column_range = range(area_regions[0], area_regions[2] + 1)
             row_range = range(area_regions[1], area_regions[3] + 1)
 
-        size_estimate = f'{self.TILE_SIZE * len(column_range)}x{self.TILE_SIZE * len(row_range)}'
+        # Where 0, 0 in our Minecraft world is in relation to the full grid of regions being stitched,
+        # and the part of that grid the image will actually cover
+        game_zero_in_grid = MapImageCoord(-self.TILE_SIZE * column_range.start, -self.TILE_SIZE * row_range.start)
+        canvas_box: Rectangle = (0, 0, self.TILE_SIZE * len(column_range), self.TILE_SIZE * len(row_range))
+        if area:
+            # Only allocate and paste into the requested area, rather than cropping it out of every region it touches
+            zero_x, zero_y = game_zero_in_grid.as_tuple()
+            canvas_box = (
+                zero_x + (area[0] // detail_mul), zero_y + (area[1] // detail_mul),
+                zero_x + (area[2] // detail_mul), zero_y + (area[3] // detail_mul),
+            )
+            autotrim = False
+
+        size_estimate = f'{canvas_box[2] - canvas_box[0]}x{canvas_box[3] - canvas_box[1]}'
         if not self.confirmation_callback(f'Estimated image size before trimming: {size_estimate}\nContinue?'):
             logger.info('Cancelling...')
             return None
 
+        # Without a grid to draw first, centering the map within the forced size can be done by stitching straight into
+        # a canvas of that size, instead of building the map and then copying it into a second, resized canvas.
+        # Not done with an area, since the forced size could then reveal parts of the regions outside of that area
+        draw_grid = all(n > 0 for n in self.grid_interval) and (self.style.show_grid_text or self.style.show_grid_lines)
+        resize = bool(force_size) and all(n > 0 for n in force_size)
+        if resize:
+            autotrim = False
+        force_size_fused = resize and (not draw_grid) and (not area)
+        if force_size_fused:
+            assert force_size
+            logger.info(f'Resizing to {force_size[0]}x{force_size[1]}...')
+            offset_x = (force_size[0] // 2) - ((canvas_box[2] - canvas_box[0]) // 2)
+            offset_y = (force_size[1] // 2) - ((canvas_box[3] - canvas_box[1]) // 2)
+            canvas_box = (
+                canvas_box[0] - offset_x, canvas_box[1] - offset_y,
+                canvas_box[0] - offset_x + force_size[0], canvas_box[1] - offset_y + force_size[1],
+            )
+
         # Start stitching
         image = Image.new(
             mode='RGBA',
-            size=(self.TILE_SIZE * len(column_range), self.TILE_SIZE * len(row_range))
+            size=(canvas_box[2] - canvas_box[0], canvas_box[3] - canvas_box[1])
         )
         logger.info('Constructing image...')
 
         ta = time.perf_counter()
-        # Represents where 0, 0 in our Minecraft world is, in relation to the image's coordinates
-        game_zero_in_image: Coord2i | None = None
-        regions_iter: list[tuple[int, int]] = list(product(column_range, row_range))
-        for c, r in (pbar := tqdm(regions_iter, disable=not self.use_tqdm)):
-            pbar.set_description(f'Region: {c}, {r}')
-            logger.log('GUI_COMMAND', f'/pbar set {pbar.n / len(regions_iter)}')
-
-            if (c not in regions) or (r not in regions[c]):
-                continue
-
-            # The pasting coordinates are determined based on what current column and row the for loops
-            # are on, so they'll increase by a tile regardless of whether an image has actually been pasted
-            tile_path = regions[c][r]
-            if self.use_tqdm:
-                tqdm.write(f'Pasting image: {tile_path}')
+        # Row by row, so that consecutive pastes write to neighbouring memory in the canvas
+        regions_iter: list[tuple[int, int]] = [(c, r) for r, c in product(row_range, column_range)]
+        tile_paths: list[str] = [regions[cr] for cr in regions_iter if cr in regions]
+        tile_size = self.TILE_SIZE
+        # Subtracted from a region's column/row times the tile size to get its position on the canvas
+        origin_x = tile_size * column_range.start + canvas_box[0]
+        origin_y = tile_size * row_range.start + canvas_box[1]
+        # If every region is present and fully opaque, the canvas is guaranteed to be completely filled,
+        # as long as it doesn't reach past the edges of the regions
+        canvas_filled = (len(tile_paths) == len(regions_iter)) and (min(canvas_box[0:2]) >= 0) \
+            and (canvas_box[2] <= tile_size * len(column_range)) and (canvas_box[3] <= tile_size * len(row_range))
+        # The area covered by every tile that's actually been pasted; nothing outside of it can be non-transparent
+        pasted_extent: Rectangle | None = None
+        with ThreadPoolExecutor(max_workers=self.TILE_LOADING_THREADS) as executor:
+            # Tiles are decoded in worker threads (Pillow releases the GIL while decoding) and handed back in the same
+            # order as tile_paths, while pasting stays on this thread
+            loaded_tiles = bounded_map(executor, self._load_tile, tile_paths, self.TILE_LOADING_THREADS * 2)
+            gui_percent = -1
+            for c, r in (pbar := tqdm(regions_iter, disable=not self.use_tqdm)):
+                # The description is shown on the bar's next scheduled refresh, rather than forcing a redraw for every region
+                if self.use_tqdm:
+                    pbar.set_description(f'Region: {c}, {r}', refresh=False)
+                if (percent := (100 * pbar.n) // len(regions_iter)) != gui_percent:
+                    gui_percent = percent
+                    logger.log('GUI_COMMAND', f'/pbar set {percent / 100}')
+
+                tile_path = regions.get((c, r))
+                if tile_path is None:
+                    continue
 
-            x, y = self.TILE_SIZE * (c - min(column_range)), self.TILE_SIZE * (r - min(row_range))
-            paste_area = Rectangle([x, y, x + self.TILE_SIZE, y + self.TILE_SIZE])
-            if not game_zero_in_image:
-                game_zero_in_image = Coord2i(x, y) - (Coord2i(c, r) * self.TILE_SIZE)
-            image.paste((tile_img := Image.open(tile_path)), paste_area, mask=tile_img)
+                # The pasting coordinates are determined based on what current column and row the for loops
+                # are on, so they'll increase by a tile regardless of whether an image has actually been pasted.
+                # Tiles hanging over the edge of the canvas are clipped by paste()
+                x = tile_size * c - origin_x
+                y = tile_size * r - origin_y
+                paste_area: Rectangle = (x, y, x + tile_size, y + tile_size)
+                tile_img, (alpha_min, alpha_max) = next(loaded_tiles)
+                opaque = alpha_min == 255
+                canvas_filled = canvas_filled and opaque
+                # A fully transparent tile wouldn't change anything on the (already transparent) canvas
+                if alpha_max == 0:
+                    continue
+                pasted_extent = (
+                    min(pasted_extent[0], x), min(pasted_extent[1], y),
+                    max(pasted_extent[2], x + tile_size), max(pasted_extent[3], y + tile_size),
+                ) if pasted_extent else paste_area
+                # Using the tile as its own mask only matters where it has transparency; a plain paste is much faster
+                image.paste(tile_img, paste_area, mask=None if opaque else tile_img)
 
         logger.log('GUI_COMMAND', '/pbar hide')
 
-        assert game_zero_in_image, AssertionMessage.GAME_ZERO_IS_NONE
-        image = MapImage(image, MapImageCoord(*game_zero_in_image), detail_mul)
-        del game_zero_in_image
-
-        # Crop if an area is specified
-        if area:
-            crop_area = (
-                *GameCoord(area[0], area[1]).to_image_coord(image).as_tuple(),
-                *GameCoord(area[2], area[3]).to_image_coord(image).as_tuple()
-            )
-            image = image.crop(crop_area)
-            autotrim = False
+        image = MapImage(image, MapImageCoord(*game_zero_in_grid - canvas_box[0:2]), detail_mul)
 
         # Things like grid lines and coordinate text are likely to end up drawn outside of the image's original bounding box,
         # altering what getbbox() would return. Get this bounding box *first*, and then use it to autotrim later.
-        bbox = image.getbbox()
-        assert bbox, AssertionMessage.BBOX_IS_NONE
+        # A completely filled canvas doesn't need scanning to know that its bounding box is the whole image.
+        # Only needed for autotrimming; without it, a map that's empty within the canvas is still a valid result
+        bbox: Rectangle | None = None
+        if autotrim:
+            if canvas_filled and all(image.size):
+                bbox = (0, 0, *image.size)
+            elif pasted_extent:
+                bbox = self._find_bbox(image.img, (
+                    max(pasted_extent[0], 0), max(pasted_extent[1], 0),
+                    min(pasted_extent[2], image.width), min(pasted_extent[3], image.height),
+                ), self.TILE_SIZE)
+            assert bbox, AssertionMessage.BBOX_IS_NONE
 
         # Add grid and/or coordinates
-        if all(n > 0 for n in self.grid_interval):
+        if draw_grid:
             if self.style.show_grid_text:
                 self.draw_grid_coords_text(image)
 
@@ -499,19 +631,27 @@ class Combiner:
                 self.draw_grid_lines(image)
 
         # Crop and resize if given an explicit size
-        if force_size and all(n > 0 for n in force_size):
+        if resize and not force_size_fused:
+            assert force_size
             logger.info(f'Resizing to {force_size[0]}x{force_size[1]}...')
             image = image.resize_canvas(*force_size)
-            autotrim = False
 
         # Trim transparent excess space
         if autotrim:
             logger.info(f'Trimming out blank space... ({image.width}x{image.height} -> {bbox[2] - bbox[0]}x{bbox[3] - bbox[1]})')
-            image = image.crop(bbox)
-
-        # Apply desired background color, if any
-        if self.style.background_color != (0, 0, 0, 0):
-            image_bg = Image.new('RGBA', size=image.size, color=self.style.background_color.to_rgba())
+            # Combined maps can easily go past Pillow's decompression bomb threshold, which crop() checks against;
+            # this image was made from trusted tiles and its size already confirmed, so only lift the limit for this crop
+            max_image_pixels, Image.MAX_IMAGE_PIXELS = Image.MAX_IMAGE_PIXELS, None
+            try:
+                image = image.crop(bbox)
+            finally:
+                Image.MAX_IMAGE_PIXELS = max_image_pixels
+
+        # Apply desired background color, if any; there's nothing for it to show through if it's fully transparent itself,
+        # or if the image has no transparency at all
+        background_color = self.style.background_color
+        if (background_color.alpha > 0) and (image.img.getextrema()[3][0] < 255):
+            image_bg = Image.new('RGBA', size=image.size, color=background_color.to_rgba())
             image_bg.alpha_composite(image.img)
             image = MapImage(image_bg, image.game_zero, image.detail_mul)
 
@@ -12,5 +12,4 @@ class CombineError(Exception):
 
 class AssertionMessage:
     """Messages to use when certain assertions have failed."""
-    GAME_ZERO_IS_NONE = 'Could not locate the game world\'s center point! ' + REPORT_BUG
     BBOX_IS_NONE = 'getbbox() failed! ' + REPORT_BUG
@@ -3,6 +3,7 @@ Callables primarily for use in GUI callbacks.
 """
 
 import json
+import os
 import re
 import subprocess
 import sys
@@ -156,7 +157,7 @@ def create_image() -> Image.Image | None:
             f'Do you want to overwrite it? If you choose no, the file will be saved to "{new_out_file.stem}" instead.'):
             out_file = new_out_file
 
-    result.img.save(out_file)
+    result.save(out_file)
     logger.info(f'Image saved to: {out_file.absolute()}')
 
     logger.info('Image creation complete!')
@@ -197,9 +198,17 @@ def update_detail_choices(world: str):
     the contents of the selected world folder.
     """
     tiles_dir: str = dpg.get_value('tiles-dir-input') or ''
-    levels: list[str] = [p.stem for p in Path(tiles_dir, world).rglob('*/')]
+    # Only the world folder's own subdirectories matter; searching recursively would also list every tile inside them
+    world_dir = Path(tiles_dir, world)
+    levels: list[str] = []
+    if world_dir.is_dir():
+        with os.scandir(world_dir) as entries:
+            levels = [e.name for e in entries if e.is_dir()]
     dpg.configure_item('detail-invalid', show=not bool(levels))
-    dpg.configure_item('detail-choices', items=levels, show=bool(levels), default_value=levels[0])
+    if not levels:
+        dpg.configure_item('detail-choices', items=[], show=False)
+        return
+    dpg.configure_item('detail-choices', items=levels, show=True, default_value=levels[0])
 
 @dpg_callback
 def open_notice_dialog_callback(args: CallbackArgs):
@@ -303,9 +312,9 @@ def update_console(message: str):
     new_log = dpg.add_text(default_value=message, parent='console-output-window', wrap=CONSOLE_TEXT_WRAP)
     match level[0]:
         case 'WARNING':
-            dpg.bind_item_theme(new_log, Themes().console_warning)
+            dpg.bind_item_theme(new_log, Themes.instance().console_warning)
         case 'ERROR':
-            dpg.bind_item_theme(new_log, Themes().console_error)
+            dpg.bind_item_theme(new_log, Themes.instance().console_error)
     dpg.set_y_scroll('console-output-window', value=-1)
 
 @dpg_callback
@@ -40,6 +40,9 @@ def main(): # pylint: disable=missing-function-docstring
     )
     dpg.setup_dearpygui()
 
+    logger.info('Configuring fonts...')
+    fonts = styling.configure_fonts()
+
     logger.info('Building layout...')
     layout.build_layout(DEBUG_MODE)
 
@@ -57,11 +60,9 @@ def main(): # pylint: disable=missing-function-docstring
             logger.info('Loading autosaved style settings...')
             actions.load_style_options(STYLE_AUTOSAVE_PATH)
 
-    logger.info('Applying themes...')
+    logger.info('Applying themes & fonts...')
     styling.apply_themes()
-
-    logger.info('Configuring fonts...')
-    styling.configure_fonts()
+    styling.bind_item_fonts(fonts)
 
     logger.info('Setting icon...')
     dpg.set_viewport_small_icon(str(GUI_ASSET_DIR / 'icon.ico'))
@@ -4,13 +4,13 @@ Handles building the main GUI layout.
 
 import json
 import webbrowser
-from dataclasses import asdict
+from dataclasses import fields
 from pprint import pprint
 from typing import Any, Callable, cast
 
 import dearpygui.dearpygui as dpg
 
-from squaremap_combine.combine_core import CombinerStyle, Coord2i
+from squaremap_combine.combine_core import DEFAULT_COMBINER_STYLE, CombinerStyle, Coord2i
 from squaremap_combine.gui import actions
 from squaremap_combine.gui.models import UserData
 from squaremap_combine.helper import Color
@@ -25,6 +25,9 @@ INDENT_WIDTH = 50
 
 MESSAGE_NO_DIR = 'None to display; choose a valid tiles directory above.'
 
+DEFAULT_STYLE_OPTIONS: dict[str, Any] = json.loads(DEFAULT_COMBINER_STYLE.to_json())
+"""The default `CombinerStyle` as a dictionary suitable for `actions.set_style_options`."""
+
 class ElemGroup:
     """Class that allows putting individual items into named groups, primarily for batch operations on multiple items.
     The class is not meant to be instanced; it holds one private `_groups` attribute can be accessed and modified with
@@ -45,9 +48,7 @@ class ElemGroup:
         if isinstance(groups, str):
             groups = [groups]
         for g in groups:
-            if g not in cls._groups:
-                cls._groups[g] = []
-            cls._groups[g].append(item)
+            cls._groups.setdefault(g, []).append(item)
         return item
 
     @classmethod
@@ -100,9 +101,9 @@ def build_combiner_style_editor():
         dpg.add_button(label='Open docs in browser',
             callback=lambda: webbrowser.open(PROJECT_DOCS_URL + 'squaremap_combine/combine_core.html#CombinerStyle'))
 
-    style_base = CombinerStyle()
-    for attr, val in asdict(style_base).items():
-        cls = type(val)
+    for field in fields(CombinerStyle):
+        attr = field.name
+        cls = type(getattr(DEFAULT_COMBINER_STYLE, attr))
         dpg.add_text(default_value=attr.title().replace('_', ' '))
         with dpg.tooltip(parent=dpg.last_item()):
             dpg.add_text(default_value=attr)
@@ -120,10 +121,32 @@ def build_combiner_style_editor():
             user_data=UserData(other={'initialfile': 'style.json'}, cb_forward_to=(actions.save_style_options, lambda *args: None)))
         dpg.add_button(label='Load from file...', callback=actions.file_open_dialog_callback,
             user_data=UserData(cb_forward_to=(actions.load_style_options, lambda *args: None)))
-        dpg.add_button(label='Reset to default', callback=lambda: actions.set_style_options(json.loads(style_base.to_json())))
+        dpg.add_button(label='Reset to default', callback=lambda: actions.set_style_options(DEFAULT_STYLE_OPTIONS))
 
     # Load default
-    actions.set_style_options(json.loads(style_base.to_json()))
+    actions.set_style_options(DEFAULT_STYLE_OPTIONS)
+
+#region DEBUG CALLBACKS
+def debug_print_groups():
+    """Prints every `ElemGroup` group and its items."""
+    pprint(ElemGroup._groups) # pylint: disable=protected-access
+
+def debug_print_image_settings_group():
+    """Prints the items of the "image-settings" `ElemGroup`."""
+    pprint(ElemGroup.get('image-settings'))
+
+def debug_print_image_options():
+    """Prints the result of `actions.get_image_options`."""
+    pprint(actions.get_image_options())
+
+def debug_print_style_settings_group():
+    """Prints the items of the "combiner-style-settings" `ElemGroup`."""
+    pprint(ElemGroup.get('combiner-style-settings'))
+
+def debug_print_style_options():
+    """Prints the result of `actions.get_style_options`."""
+    pprint(actions.get_style_options())
+#endregion DEBUG CALLBACKS
 
 def build_layout(debugging: bool=False):
     """Builds the basic GUI app layout.
@@ -288,15 +311,11 @@ def build_layout(debugging: bool=False):
         dpg.add_button(label='Hide progress bar', callback=lambda: dpg.configure_item('progress-bar', show=False))
         dpg.add_text(default_value='Progress bar value:')
         dpg.add_input_text(on_enter=True, callback=lambda s,a,d: dpg.configure_item('progress-bar', default_value=float(a)))
-        dpg.add_button(label='Print element groups', callback=lambda: pprint(ElemGroup._groups)) # pylint: disable=protected-access
-        dpg.add_button(label='Print image settings group',
-            callback=lambda: pprint(ElemGroup._groups['image-settings'])) # pylint: disable=protected-access
-        dpg.add_button(label='Print gathered image options',
-            callback=lambda: pprint(actions.get_image_options()))
-        dpg.add_button(label='Print style settings group',
-            callback=lambda: pprint(ElemGroup._groups['combiner-style-settings'])) # pylint: disable=protected-access
-        dpg.add_button(label='Print gathered style options',
-            callback=lambda: pprint(actions.get_style_options()))
+        dpg.add_button(label='Print element groups', callback=debug_print_groups)
+        dpg.add_button(label='Print image settings group', callback=debug_print_image_settings_group)
+        dpg.add_button(label='Print gathered image options', callback=debug_print_image_options)
+        dpg.add_button(label='Print style settings group', callback=debug_print_style_settings_group)
+        dpg.add_button(label='Print gathered style options', callback=debug_print_style_options)
 
     # Primary window
     with dpg.window(tag='main-window'):
@@ -6,10 +6,11 @@ from dataclasses import dataclass
 from typing import Any, Callable, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserData:
     """Data model to provide typing and consistency to using `dearpygui`'s `user_data` parameter.
-    Every attribute is optional.
+    Every attribute is optional. Instances are immutable; callbacks given a plain `dict` or no `user_data` at all
+    wrap it in a new instance rather than modifying an existing one.
     """
     other: Any = None
     """Miscellaneous info to be passed on for any purpose. Should only be used if no other properties fit."""
@@ -2,16 +2,37 @@
 Handles building and applying themes and fonts to the GUI layout.
 """
 
-from functools import cache
-
 import dearpygui.dearpygui as dpg
 
 from squaremap_combine.project import ASSET_DIR
 
+FONTS: dict[str, tuple[str, int]] = {
+    'regular': ('selawk.ttf', 20),
+    'h1': ('selawkb.ttf', 30),
+    'h2': ('selawkb.ttf', 40),
+    'mono': ('SourceCodePro-SemiBold.ttf', 20),
+}
+"""Font files (relative to `ASSET_DIR`) and sizes to register, keyed by the name they are referred to with."""
+
+ITEM_FONTS: dict[str, str] = {
+    'title-text': 'h1',
+    'console-output-window': 'mono',
+}
+"""Which registered font (by name, see `FONTS`) to bind to each item tag."""
 
 class Themes:
-    """Builds `dearpygui` themes for GUI modules."""
-    @cache # pylint: disable=method-cache-max-size-none; we deliberately want this class to only ever have one instance defined
+    """Builds `dearpygui` themes for GUI modules.
+    Only one set of themes should ever be built; use `Themes.instance()` rather than constructing this class directly.
+    """
+    _instance: 'Themes | None' = None
+
+    @classmethod
+    def instance(cls) -> 'Themes':
+        """Returns the shared `Themes` instance, building it on the first call."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     def __init__(self):
         with dpg.theme() as self.base:
             with dpg.theme_component(dpg.mvAll):
@@ -99,20 +120,29 @@ class Themes:
 
 def apply_themes():
     """Binds themes to their respective items."""
-    themes = Themes()
+    themes = Themes.instance()
     dpg.bind_theme(themes.base)
-    dpg.bind_item_font('title-text', themes.h1)
+    dpg.bind_item_theme('title-text', themes.h1)
     dpg.bind_item_theme('console-output-window', themes.console)
     dpg.bind_item_theme('tabs-group', themes.tabs)
 
-def configure_fonts():
-    """Registers fonts and binds them to their respective items."""
+def configure_fonts() -> dict[str, int | str]:
+    """Registers every font in `FONTS` and binds the "regular" font as the default.
+    Should be called before the layout is built, so that items are created with the correct font from the start.
+
+    :returns: The registered fonts' identifiers, keyed by the same names used in `FONTS`.
+    :rtype: dict[str, int | str]
+    """
     with dpg.font_registry():
-        font_sans_regular = dpg.add_font(str(ASSET_DIR / 'selawk.ttf'), 20)
-        font_sans_regular_h1 = dpg.add_font(str(ASSET_DIR / 'selawkb.ttf'), 30)
-        font_sans_regular_h2 = dpg.add_font(str(ASSET_DIR / 'selawkb.ttf'), 40)
-        font_mono = dpg.add_font(str(ASSET_DIR / 'SourceCodePro-SemiBold.ttf'), 20)
-
-    dpg.bind_font(font_sans_regular)
-    dpg.bind_item_font('title-text', font_sans_regular_h1)
-    dpg.bind_item_font('console-output-window', font_mono)
+        fonts = {name: dpg.add_font(str(ASSET_DIR / file), size) for name, (file, size) in FONTS.items()}
+
+    dpg.bind_font(fonts['regular'])
+    return fonts
+
+def bind_item_fonts(fonts: dict[str, int | str]):
+    """Binds registered fonts to their respective items as defined in `ITEM_FONTS`.
+
+    :param fonts: Font identifiers as returned by `configure_fonts`.
+    """
+    for item, font_name in ITEM_FONTS.items():
+        dpg.bind_item_font(item, fonts[font_name])
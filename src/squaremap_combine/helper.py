@@ -2,19 +2,23 @@
 Miscellaneous helper utility functions and classes.
 """
 
-import re
-from functools import wraps
-from itertools import batched
+from collections import deque
+from concurrent.futures import Executor, Future
+from dataclasses import fields, is_dataclass
+from functools import lru_cache, update_wrapper
 from json import JSONEncoder
-from math import floor
-from typing import Any, Callable, Concatenate, ParamSpec, Protocol, Self, TypeVar
+from typing import Any, Callable, Concatenate, Iterable, Iterator, ParamSpec, Protocol, Self, TypeVar, cast
 
-from squaremap_combine.type_alias import Rectangle
+from squaremap_combine.type_alias import ColorRGBA, Rectangle
 
 T = TypeVar('T')
+R = TypeVar('R')
 P = ParamSpec('P')
 """@private"""
 
+_HEX_BYTES: tuple[str, ...] = tuple(f'{n:02x}' for n in range(256))
+"""Two-character lowercase hex strings for every value from 0 to 255, indexed by value."""
+
 class ConfirmationCallback(Protocol):
     """Typing protocol for `combine_core.Combiner.combine()`'s `confirmation_callback` argument."""
     def __call__(self, message: str, *args: Any, **kwargs: Any) -> bool:
@@ -35,7 +39,9 @@ class Color:
     | `"{magenta:rgb}"`  | `"(255, 0, 255)"`      |
     | `"{magenta:rgba}"` | `"(255, 0, 255, 255)"` |
     """
-    HEXCODE_REGEX = re.compile(r"^[0-9a-f]{3}$|^[0-9a-f]{6}$|^[0-9a-f]{8}$")
+    __slots__ = ('red', 'green', 'blue', 'alpha')
+
+    HEX_DIGITS = '0123456789abcdef'
     COMMON: dict[str, tuple[int, ...]] = {
         'transparent': (  0,   0,   0,   0),
         'white'      : (255, 255, 255),
@@ -49,22 +55,17 @@ class Color:
     }
 
     def __init__(self, red: int, green: int, blue: int, alpha: int=255):
-        if 0 >= red > 255:
-            raise ValueError(f'Channel value cannot be less than 0 or more than 255; was given a red value of {red}')
+        # Any bits set outside of the lowest 8 mean at least one channel is above 255 or negative
+        if (red | green | blue | alpha) & ~0xff:
+            raise ValueError('Channel values cannot be less than 0 or more than 255;' +
+                f' was given red={red}, green={green}, blue={blue}, alpha={alpha}')
         self.red   = red
-        if 0 >= green > 255:
-            raise ValueError(f'Channel value cannot be less than 0 or more than 255; was given a green value of {green}')
         self.green = green
-        if 0 >= blue > 255:
-            raise ValueError(f'Channel value cannot be less than 0 or more than 255; was given a blue value of {blue}')
         self.blue  = blue
-        if 0 >= alpha > 255:
-            raise ValueError(f'Channel value cannot be less than 0 or more than 255; was given an alpha value of {alpha}')
         self.alpha = alpha
 
-    def __iter__(self):
-        for i in [self.red, self.green, self.blue, self.alpha]:
-            yield i
+    def __iter__(self) -> Iterator[int]:
+        return iter((self.red, self.green, self.blue, self.alpha))
 
     def __repr__(self) -> str:
         return f'Color(red={self.red}, green={self.green}, blue={self.blue}, alpha={self.alpha})'
@@ -74,7 +75,8 @@ class Color:
 
     def __format__(self, fmt: str) -> str:
         if fmt.startswith('hex'):
-            return self.to_hex()[:int(fmt.split('hex')[1] or len(self.to_hex()) + 1)]
+            hexcode = self.to_hex()
+            return hexcode[:int(fmt[3:])] if len(fmt) > 3 else hexcode
         if fmt == 'rgb':
             return str(self.to_rgb())
         if fmt == 'rgba':
@@ -86,7 +88,9 @@ class Color:
         """Checks whether the given string is a valid 6 or 8 character hexcode, and returns the string if so, returning `None` if invalid.
         A 3 or 6 character hexcode will be converte to 8 by this function.
         """
-        if not re.match(Color.HEXCODE_REGEX, hexcode):
+        # Anything left after stripping valid digits means an invalid character was present;
+        # checked explicitly since int(..., 16) would otherwise accept things like "0x", "_", or whitespace
+        if (len(hexcode) not in (3, 6, 8)) or hexcode.strip(Color.HEX_DIGITS):
             return None
         if len(hexcode) == 3:
             hexcode *= 2
@@ -107,9 +111,20 @@ class Color:
         The last 2 characters of an 8-character hexcode are used for the alpha value.
         Any 6-character hexcode will have the resulting color's alpha assumed to be 255.
         """
-        if not (hexcode := cls.ensure_hex_format(hex_string)):
+        if not (channels := cls._parse_hex(hex_string)):
             raise ValueError('Invalid hexcode given; must be 3, 6, or 8 characters long')
-        return cls(*[int(''.join(channel), 16) for channel in batched(hexcode, 2)])
+        return cls(*channels)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_hex(hex_string: str) -> ColorRGBA | None:
+        """Returns the RGBA channel values of a hexcode string, or `None` if it is invalid. See `from_hex`.
+        Results are cached, since the same few hexcodes tend to be parsed repeatedly when loading styles.
+        """
+        if not (hexcode := Color.ensure_hex_format(hex_string)):
+            return None
+        value = int(hexcode, 16)
+        return (value >> 24) & 0xff, (value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff
 
     def to_rgb(self) -> tuple[int, int, int]:
         """Converts this color to a three-integer tuple representing its RGB values."""
@@ -121,14 +136,16 @@ class Color:
 
     def to_hex(self) -> str:
         """Converts this color to a hexcode string."""
-        return ''.join([hex(channel)[2:].zfill(2) for channel in self])
+        return _HEX_BYTES[self.red] + _HEX_BYTES[self.green] + _HEX_BYTES[self.blue] + _HEX_BYTES[self.alpha]
 
 class StyleJSONEncoder(JSONEncoder):
     """Extended JSON encoder to aid in serializing `CombinerStyle` objects."""
     def default(self, o: Any) -> tuple | dict:
         if isinstance(o, Color):
-            return tuple(o)
-        return o.__dict__
+            return o.to_rgba()
+        if is_dataclass(o) and not isinstance(o, type):
+            return {field.name: getattr(o, field.name) for field in fields(o)}
+        return super().default(o)
 
 def confirm_yn(message: str, override: bool=False) -> bool:
     """Prompts the user for confirmation, only returning true if "Y" or "y" was entered."""
@@ -140,16 +157,32 @@ def filled_tuple(source_tuple: tuple[T] | tuple[T, T]) -> tuple[T, T]:
     """
     return source_tuple if len(source_tuple) == 2 else (source_tuple[0], source_tuple[0])
 
+def bounded_map(executor: Executor, func: Callable[[T], R], items: Iterable[T], max_pending: int) -> Iterator[R]:
+    """Works like `Executor.map`, yielding results in the same order as `items`, but only keeps up to `max_pending` calls
+    submitted at once. New calls are only submitted as results are consumed, so that finished results can't pile up in memory
+    if they're produced faster than they're used.
+
+    :param executor: `Executor` to submit calls to.
+    :param func: `Callable` to call with each item.
+    :param items: Items to call `func` with.
+    :param max_pending: Maximum amount of calls that can be submitted but not yet consumed at any one time.
+    """
+    pending: deque[Future[R]] = deque()
+    for item in items:
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+        pending.append(executor.submit(func, item))
+    while pending:
+        yield pending.popleft().result()
+
 def copy_method_signature(source: Callable[Concatenate[Any, P], T]) -> Callable[[Callable[..., T]], Callable[Concatenate[Any, P], T]]:
     """Copies a method signature onto the decorated method.
 
     Taken from: https://github.com/python/typing/issues/270#issuecomment-1346124813
     """
     def wrapper(target: Callable[..., T]) -> Callable[Concatenate[Any, P], T]:
-        @wraps(source)
-        def wrapped(self: Any, /, *args: P.args, **kwargs: P.kwargs) -> T: # pylint: disable=no-member
-            return target(self, *args, **kwargs)
-        return wrapped
+        # Only the metadata is copied; the target itself is returned so that calling it doesn't go through an extra frame
+        return cast(Callable[Concatenate[Any, P], T], update_wrapper(target, source))
     return wrapper
 
 def snap_num(num: int | float, multiple: int, snap_method: Callable) -> int:
@@ -160,4 +193,5 @@ def snap_box(box: Rectangle, multiple: int) -> Rectangle:
     """Snaps the given four box coordinates to their lowest `multiple` they can reside in. See `snap_num`.
     Since regions are named based off of their "coordinate" as their top-left point, the lowest multiples are all that matter.
     """
-    return tuple(map(lambda n: snap_num(n, multiple, floor), box)) # type: ignore
+    x1, y1, x2, y2 = box
+    return (x1 // multiple) * multiple, (y1 // multiple) * multiple, (x2 // multiple) * multiple, (y2 // multiple) * multiple
@@ -10,6 +10,10 @@ from loguru import logger
 
 from squaremap_combine.project import LOGS_DIR
 
+STDOUT_LOG_FORMAT = '<level>[{time:HH:mm:ss}] {level}: {message}</level>'
+FILE_LOG_FORMAT = '[{time:HH:mm:ss}] {level}: {message}'
+LOG_FILE_NAME_FORMAT = '{time:YYYY-MM-DD_HH-mm-ss}.log'
+
 logger.level('GUI_COMMAND', no=0)
 
 logger.remove() # Don't output anything if this is just being imported
@@ -31,8 +35,8 @@ def enable_logging(target_logger: 'loguru.Logger', stdout_level: str='INFO', out
     target_logger.level('ERROR', color='<red>')
 
     stdout_handler = target_logger.add(sys.stdout, colorize=True,
-        format="<level>[{time:HH:mm:ss}] {level}: {message}</level>", level=stdout_level, diagnose=False)
-    file_handler = target_logger.add(output_dir / '{time:YYYY-MM-DD_HH-mm-ss}.log',
-        format="[{time:HH:mm:ss}] {level}: {message}", level='DEBUG', mode='w', retention=5, diagnose=False)
+        format=STDOUT_LOG_FORMAT, level=stdout_level, diagnose=False)
+    file_handler = target_logger.add(output_dir / LOG_FILE_NAME_FORMAT,
+        format=FILE_LOG_FORMAT, level='DEBUG', mode='w', retention=5, diagnose=False)
 
     return stdout_handler, file_handler
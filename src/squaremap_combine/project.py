@@ -3,7 +3,6 @@ Holds constants and functions regarding general project information to be shared
 """
 
 import importlib.metadata
-import os
 from pathlib import Path
 
 import platformdirs
@@ -12,7 +11,7 @@ PROJECT_NAME = 'squaremap_combine'
 PROJECT_VERSION = importlib.metadata.version('squaremap_combine')
 PROJECT_DOCS_URL = 'https://squaremap-combine.readthedocs.io/en/latest/'
 
-MODULE_DIR = Path(os.path.realpath(__file__)).parent
+MODULE_DIR = Path(__file__).parent
 
 LOGS_DIR = MODULE_DIR / 'logs'
 ASSET_DIR = MODULE_DIR / 'asset'
@@ -5,7 +5,9 @@ for the tests to compare against. This should generally not be done unless there
 
 import json
 import os
+import shutil
 from dataclasses import dataclass, field
+from functools import cache
 from hashlib import sha256
 from io import BytesIO
 from pathlib import Path
@@ -15,7 +17,7 @@ import pytest
 from PIL import Image
 from tqdm import tqdm
 
-from squaremap_combine.combine_core import Combiner
+from squaremap_combine.combine_core import Combiner, GameCoord, MapImage
 
 TEST_TILES = Path('example-tiles')
 TEST_CONTROL = Path('tests/data/control') # Control group, image results to check tests against
@@ -31,6 +33,18 @@ class CombinerTestParams:
 WORLDS = ['minecraft_overworld', 'minecraft_the_nether', 'minecraft_the_end']
 DETAIL_LEVELS = [0, 1, 2, 3]
 
+TEST_AREAS = [(-300, -300, 700, 500), (-1001, 37, 999, 1003)]
+# Images of 16px "tiles" for `Combiner._find_bbox`, given as (size, opaque pixels)
+FIND_BBOX_CASES: dict[str, tuple[tuple[int, int], list[tuple[int, int]]]] = {
+    'every-edge-strip': ((80, 80), [(3, 40), (40, 9), (70, 21), (33, 77)]),
+    'interior-tiles-only': ((80, 80), [(20, 20), (50, 60)]),
+    'one-edge-strip-empty': ((80, 80), [(3, 40), (40, 9), (50, 50), (33, 77)]),
+    'corners-only': ((80, 64), [(0, 0), (79, 63)]),
+    'empty': ((80, 80), []),
+    'smaller-than-a-tile': ((10, 7), [(2, 3), (8, 5)]),
+}
+TEST_FORCE_SIZES = [(3000, 2500), (1001, 777), (300, 200)] # Larger, around the same size as, and smaller than the content
+
 TEST_PARAMS_OUTLINE: dict[str, CombinerTestParams] = {
     'basic': CombinerTestParams(),
     'grid512': CombinerTestParams(cls_kwargs={'grid_interval': (512, 512)})
@@ -118,6 +132,28 @@ def check_missing_control():
     if diff:
         raise KeyError(f'Control hashes are missing for these tests: {', '.join(diff)}')
 
+@cache
+def render_full_map(detail: int, tiles_dir: Path = TEST_TILES / '2000x2000') -> MapImage:
+    """Combines the entire overworld of the given tiles at the given detail level, for other tests to compare against.
+    Cached, since several tests need the same image; callers should only crop or copy it, never draw onto it.
+    """
+    return Combiner(tiles_dir).combine(world='minecraft_overworld', detail=detail)
+
+def crop_full_map(detail: int, area: tuple[int, int, int, int], tiles_dir: Path = TEST_TILES / '2000x2000') -> MapImage:
+    """Crops the given game coordinate area out of the full map render."""
+    full = render_full_map(detail, tiles_dir)
+    return full.crop((*GameCoord(*area[0:2]).to_image_coord(full).as_tuple(), *GameCoord(*area[2:4]).to_image_coord(full).as_tuple()))
+
+@pytest.fixture(scope='module')
+def corner_tiles(tmp_path_factory) -> Path:
+    """Copies only two opposite corner regions of the example tiles at detail 3, leaving the center of the map empty."""
+    tiles_dir = tmp_path_factory.mktemp('corner-tiles')
+    detail_dir = tiles_dir / 'minecraft_overworld' / '3'
+    detail_dir.mkdir(parents=True)
+    for name in ['-2_-2.png', '1_1.png']:
+        shutil.copy(TEST_TILES / '2000x2000' / 'minecraft_overworld' / '3' / name, detail_dir)
+    return tiles_dir
+
 #region TESTS
 @pytest.mark.parametrize('param_set', TEST_PARAMS_FULL)
 def test_map_creation(param_set):
@@ -127,6 +163,53 @@ def test_map_creation(param_set):
     test_barr = BytesIO()
     combiner.combine(**params.func_kwargs).save(test_barr, format='png')
     assert control_group_hash[name] == sha256(test_barr.getvalue()).hexdigest()
+
+def test_save_without_alpha(tmp_path):
+    """Tests that maps can be saved to formats which don't support an alpha channel."""
+    image = Combiner(TEST_TILES / '2000x2000').combine(world='minecraft_overworld', detail=0)
+    image.save(tmp_path / 'map.jpg')
+    assert Image.open(tmp_path / 'map.jpg').mode == 'RGB'
+    image.save(tmp_path / 'map.png')
+    assert Image.open(tmp_path / 'map.png').mode == 'RGBA'
+
+@pytest.mark.parametrize('grid_interval', [(0, 0), (512, 512)])
+@pytest.mark.parametrize('area', TEST_AREAS)
+@pytest.mark.parametrize('detail', [1, 3])
+def test_area_matches_full_map_crop(detail, area, grid_interval):
+    """Tests that combining only an area gives the same image as cropping that area out of the full map."""
+    expected = crop_full_map(detail, area)
+    result = Combiner(TEST_TILES / '2000x2000', grid_interval=grid_interval) \
+        .combine(world='minecraft_overworld', detail=detail, area=area)
+    assert result.size == expected.size
+    assert result.game_zero.as_tuple() == expected.game_zero.as_tuple()
+    if grid_interval == (0, 0):
+        # Grid text near the edges can differ from the full map's, so only compare pixels without a grid
+        assert result.img.tobytes() == expected.img.tobytes()
+
+@pytest.mark.parametrize('force_size', TEST_FORCE_SIZES)
+@pytest.mark.parametrize('area', [None, *TEST_AREAS])
+@pytest.mark.parametrize('detail, empty_center', [(1, False), (3, False), (3, True)])
+def test_force_size_matches_resized_canvas(detail, empty_center, area, force_size, corner_tiles):
+    """Tests that `force_size` gives the same image as centering the unforced result in a canvas of that size,
+    including when the map has nothing at its center for the forced size to contain.
+    """
+    tiles_dir = corner_tiles if empty_center else TEST_TILES / '2000x2000'
+    unforced = crop_full_map(detail, area, tiles_dir) if area else render_full_map(detail, tiles_dir)
+    expected = unforced.resize_canvas(*force_size)
+    result = Combiner(tiles_dir) \
+        .combine(world='minecraft_overworld', detail=detail, area=area, force_size=force_size)
+    assert result.size == force_size
+    assert result.game_zero.as_tuple() == expected.game_zero.as_tuple()
+    assert result.img.tobytes() == expected.img.tobytes()
+
+@pytest.mark.parametrize('case', FIND_BBOX_CASES)
+def test_find_bbox_matches_getbbox(case):
+    """Tests that `Combiner._find_bbox` finds the same bounding box as `Image.getbbox()`."""
+    size, pixels = FIND_BBOX_CASES[case]
+    image = Image.new('RGBA', size)
+    for xy in pixels:
+        image.putpixel(xy, (255, 255, 255, 255))
+    assert Combiner._find_bbox(image, (0, 0, *size), 16) == image.getbbox() # pylint: disable=protected-access
 #endregion TESTS
 
 def main(): # pylint: disable=missing-function-docstring
@@ -0,0 +1,73 @@
+"""
+Tests for `squaremap_combine.helper`.
+"""
+
+import json
+
+import pytest
+
+from squaremap_combine.combine_core import CombinerStyle
+from squaremap_combine.helper import Color
+
+#region TESTS
+@pytest.mark.parametrize('channels', [(0, 0, 0, 0), (255, 255, 255, 255), (0, 128, 255)])
+def test_color_valid_channels(channels):
+    """Tests that channel values from 0 to 255 are accepted."""
+    assert Color(*channels).to_rgb() == channels[:3]
+
+@pytest.mark.parametrize('channels', [(256, 0, 0), (0, -1, 0), (0, 0, 1000), (0, 0, 0, 256), (-255, 0, 0)])
+def test_color_invalid_channels(channels):
+    """Tests that channel values outside of 0 to 255 raise a `ValueError`."""
+    with pytest.raises(ValueError):
+        Color(*channels)
+
+@pytest.mark.parametrize('hexcode, expected', [
+    ('abc', 'abcabcff'),
+    ('ff00ff', 'ff00ffff'),
+    ('01234567', '01234567'),
+])
+def test_ensure_hex_format_valid(hexcode, expected):
+    """Tests that valid hexcodes are accepted and expanded to 8 characters."""
+    assert Color.ensure_hex_format(hexcode) == expected
+
+@pytest.mark.parametrize('hexcode', ['', 'ff', 'ffff', 'fffffff', 'fffffffff', 'ggg', '0xfff', 'f_f', ' ff', 'FF00FF', 'white'])
+def test_ensure_hex_format_invalid(hexcode):
+    """Tests that strings of the wrong length or containing non-hex characters are rejected."""
+    assert Color.ensure_hex_format(hexcode) is None
+
+def test_from_hex():
+    """Tests that hexcodes are parsed into the correct channel values."""
+    assert Color.from_hex('01234567').to_rgba() == (0x01, 0x23, 0x45, 0x67)
+    assert Color.from_hex('ff8000').to_rgba() == (255, 128, 0, 255)
+    with pytest.raises(ValueError):
+        Color.from_hex('0xfff')
+
+@pytest.mark.parametrize('hexcode', ['00000000', 'ffffffff', '0110abcd', 'ff00ff80'])
+def test_hex_round_trip(hexcode):
+    """Tests that converting a hexcode to a `Color` and back results in the same hexcode."""
+    assert Color.from_hex(hexcode).to_hex() == hexcode
+
+def test_format():
+    """Tests the format specifiers supported by `Color`."""
+    color = Color(255, 0, 255, 128)
+    assert f'{color:hex}' == 'ff00ff80'
+    assert f'{color:hex6}' == 'ff00ff'
+    assert f'{color:rgb}' == '(255, 0, 255)'
+    assert f'{color:rgba}' == '(255, 0, 255, 128)'
+
+def test_from_name():
+    """Tests that common color names give the expected values, as a new instance each time."""
+    assert Color.from_name('magenta').to_rgba() == (255, 0, 255, 255)
+    assert Color.from_name('transparent').to_rgba() == (0, 0, 0, 0)
+    color = Color.from_name('cyan')
+    color.red = 100
+    assert Color.from_name('cyan').to_rgba() == (0, 255, 255, 255)
+    with pytest.raises(KeyError):
+        Color.from_name('not-a-color')
+
+def test_style_json_round_trip():
+    """Tests that a `CombinerStyle` serialized with `StyleJSONEncoder` loads back into an identical style."""
+    style = CombinerStyle(background_color='ff0000', grid_color=[1, 2, 3], grid_text_size=20)
+    assert json.loads(CombinerStyle(**json.loads(style.to_json())).to_json()) == json.loads(style.to_json())
+    assert json.loads(style.to_json())['background_color'] == [255, 0, 0, 255]
+#endregion TESTS